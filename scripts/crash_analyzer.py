@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Analyze crashpad output captured from logcat.
+
+When the app aborts inside the proot guest, crashpad writes its report
+through the Android log as a burst of `F crashpad:` lines. This script
+pulls those fragments back out of a captured log, tries to decode the
+payload (base64 or hex), and prints whatever it can recover.
+
+Usage:
+    adb logcat -d | python3 scripts/crash_analyzer.py
+"""
+
+import base64
+import binascii
+import heapq
+import re
+import string
+import sys
+from collections import Counter
+from operator import itemgetter
+
+# The log is kept as bytes end-to-end: logcat captures can be tens of
+# MB and a fatal report is ASCII anyway, so decoding the whole input to
+# str would cost a full copy for nothing.
+_CRASHPAD_RE = re.compile(rb'F crashpad: ([^$\n]+)')
+_NON_B64_RE = re.compile(rb'[^A-Za-z0-9+/=]')
+_NON_HEX_RE = re.compile(rb'[^0-9A-Fa-f]')
+_TIMESTAMP_RE = re.compile(rb'(\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})')
+_PID_RE = re.compile(rb'(\d+)\s+\d+\s+F crashpad:')
+
+
+def extract_crashpad_data(crash_log):
+    """Concatenate the payload fragments of every `F crashpad:` line."""
+    fragments = _CRASHPAD_RE.findall(crash_log)
+    return b''.join(fragment.strip() for fragment in fragments)
+
+
+def decode_base64(data):
+    """Try to decode `data` as base64, returning bytes or None."""
+    cleaned = _NON_B64_RE.sub(b'', data)
+    if not cleaned:
+        return None
+    # Restore the padding logcat tends to eat.
+    cleaned += b'=' * (-len(cleaned) % 4)
+    try:
+        return base64.b64decode(cleaned, validate=True)
+    except (ValueError, binascii.Error):
+        return None
+
+
+def decode_hex(data):
+    """Try to decode `data` as a hex string, returning bytes or None."""
+    cleaned = _NON_HEX_RE.sub(b'', data)
+    if len(cleaned) % 2:
+        cleaned = cleaned[:-1]
+    if not cleaned:
+        return None
+    try:
+        return binascii.unhexlify(cleaned)
+    except binascii.Error:
+        return None
+
+
+def analyze_crash_context(crash_log):
+    """Pull timestamp, PID, and position info for the crashpad burst."""
+    context = {}
+    timestamp = _TIMESTAMP_RE.search(crash_log)
+    if timestamp:
+        context['timestamp'] = timestamp.group(1).decode('ascii')
+    pid = _PID_RE.search(crash_log)
+    if pid:
+        context['pid'] = int(pid.group(1))
+    # splitlines also swallows the \r of adb's CRLF output.
+    lines = crash_log.splitlines()
+    try:
+        context['first_line'] = next(
+            index for index, line in enumerate(lines)
+            if b'F crashpad:' in line
+        )
+    except StopIteration:
+        pass
+    context['total_lines'] = len(lines)
+    return context
+
+
+_DIGITS = frozenset(string.digits.encode('ascii'))
+_LETTERS = frozenset(string.ascii_letters.encode('ascii'))
+_ALNUM = _DIGITS | _LETTERS
+_WHITESPACE = frozenset(string.whitespace.encode('ascii'))
+
+
+def analyze_raw_data(data):
+    """Byte-class distribution of the recovered payload."""
+    total = len(data)
+    # One Counter pass over the payload instead of four regex sweeps.
+    counts = Counter(data)
+    printable = sum(v for k, v in counts.items() if 33 <= k <= 126)
+    digits = sum(v for k, v in counts.items() if k in _DIGITS)
+    letters = sum(v for k, v in counts.items() if k in _LETTERS)
+    special = sum(
+        v for k, v in counts.items()
+        if k not in _ALNUM and k not in _WHITESPACE
+    )
+    return {
+        'total': total,
+        'printable': printable,
+        'digits': digits,
+        'letters': letters,
+        'special': special,
+    }
+
+
+_NON_ALNUM_BYTES = bytes(b for b in range(256) if b not in _ALNUM)
+
+
+def find_common_substrings(data, min_length=3, max_length=10):
+    """Return the five most repeated alphanumeric substrings."""
+    # Drop non-alphanumeric bytes once up front so the inner loop is a
+    # bare slice feeding Counter, with no per-slice membership check.
+    alnum = data.translate(None, _NON_ALNUM_BYTES)
+    counts = Counter()
+    for length in range(min_length, max_length + 1):
+        counts.update(
+            alnum[i:i + length] for i in range(len(alnum) - length + 1)
+        )
+    # Top 5 via a bounded heap; no point sorting every unique n-gram.
+    return heapq.nlargest(
+        5, ((s, c) for s, c in counts.items() if c > 1), key=itemgetter(1)
+    )
+
+
+# Maps every non-printable byte to NUL so printable runs can be split
+# out in C with translate + split instead of a Python loop per byte.
+_PRINTABLE_TABLE = bytes(b if 32 <= b <= 126 else 0 for b in range(256))
+
+
+def extract_strings(data, min_length=4):
+    """Extract printable ASCII runs from decoded binary data."""
+    return [
+        run.decode('ascii')
+        for run in data.translate(_PRINTABLE_TABLE).split(b'\x00')
+        if len(run) >= min_length
+    ]
+
+
+# 1 for printable ASCII bytes, 0 otherwise: a branchless table index
+# instead of two comparisons per byte.
+_PRINT_LUT = bytes(1 if 32 <= b <= 126 else 0 for b in range(256))
+
+
+def printable_ratio(data):
+    """Fraction of bytes in the printable ASCII range."""
+    if not data:
+        return 0.0
+    return sum(map(_PRINT_LUT.__getitem__, data)) / len(data)
+
+
+def main():
+    crash_log = sys.stdin.buffer.read()
+    if not crash_log:
+        print('No input. Pipe a logcat capture into this script.')
+        return 1
+
+    context = analyze_crash_context(crash_log)
+    print('=== Crash Context ===')
+    for key, value in context.items():
+        print(f'  {key}: {value}')
+
+    payload = extract_crashpad_data(crash_log)
+    if not payload:
+        print('No `F crashpad:` lines found in the input.')
+        return 1
+    print(f'\nRecovered {len(payload)} payload bytes.')
+
+    print('\n=== Payload Analysis ===')
+    for key, value in analyze_raw_data(payload).items():
+        print(f'  {key}: {value}')
+
+    common = find_common_substrings(payload)
+    if common:
+        print('\n=== Repeated Substrings ===')
+        for substring, count in common:
+            print(f'  {substring.decode("ascii")!r} x{count}')
+
+    for name, decoder in (('base64', decode_base64), ('hex', decode_hex)):
+        decoded = decoder(payload)
+        if decoded is None:
+            continue
+        print(f'\n=== Decoded as {name} ({len(decoded)} bytes) ===')
+        if printable_ratio(decoded) > 0.8:
+            print(decoded.decode('ascii', errors='replace'))
+        else:
+            for text in extract_strings(decoded):
+                print(f'  {text}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())